@@ -26,14 +26,17 @@ async def initialize_bot(args: argparse.Namespace) -> None:
 
         # Initialize RSS reader
         rss_reader = RSSReader(config)
-        await rss_reader.setup()
+        try:
+            await rss_reader.setup()
 
-        # Initialize Discord bot with default intents
-        intents = discord.Intents.default()
-        bot = DiscordBot(rss_reader, intents=intents, root_logger=True)
+            # Initialize Discord bot with default intents
+            intents = discord.Intents.default()
+            bot = DiscordBot(rss_reader, intents=intents, root_logger=True)
 
-        logging.info("Bot is starting...")
-        await bot.start(bot_token)
+            logging.info("Bot is starting...")
+            await bot.start(bot_token)
+        finally:
+            rss_reader.close()
 
     # pylint: disable=W0718
     except Exception as e:
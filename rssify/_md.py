@@ -0,0 +1,148 @@
+import re
+
+from bs4 import NavigableString, Tag
+from bs4.element import PreformattedString
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_SPACES_RE = re.compile(r"^ +", re.M)
+_ESCAPE_RE = re.compile(r"([*_])")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+_SKIP_TAGS = frozenset({"head", "script", "style", "title"})
+_BLOCK_TAGS = frozenset(
+    {
+        "article",
+        "blockquote",
+        "div",
+        "figcaption",
+        "figure",
+        "p",
+        "section",
+        "table",
+    }
+)
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+_BULLETS = "*+-"
+_LIST_TAGS = ("ul", "ol")
+
+# Marks indentation that must survive the per-line whitespace cleanup
+_INDENT = "\x00"
+
+
+def tree_to_markdown(node: Tag) -> str:
+    """Converts a parsed HTML tree into Markdown format."""
+    text = "\n".join(
+        line.strip() for line in _convert_children(node).split("\n")
+    )
+    return _BLANK_LINES_RE.sub("\n\n", text).strip().replace(_INDENT, " ")
+
+
+def _convert_children(node: Tag) -> str:
+    """Converts all children of a tag and joins the results."""
+    return "".join(_convert(child) for child in node.children)
+
+
+def _indent(text: str, width: int) -> str:
+    """Protects leading spaces and indents every line by the given width."""
+    text = _LEADING_SPACES_RE.sub(lambda m: _INDENT * len(m.group()), text)
+    return "\n".join(_INDENT * width + line for line in text.split("\n"))
+
+
+def _convert_list(node: Tag) -> str:
+    """Converts a list, indenting nested lists under their parent item."""
+    depth = sum(1 for parent in node.parents if parent.name in _LIST_TAGS)
+    start = str(node.get("start", ""))
+    start = int(start) if node.name == "ol" and start.isdigit() else 1
+    items = []
+    for index, item in enumerate(node.find_all("li", recursive=False), start):
+        marker = (
+            f"{index}. " if node.name == "ol" else f"{_BULLETS[depth % 3]} "
+        )
+        lines = [
+            line.strip()
+            for line in _convert_children(item).split("\n")
+            if line.strip()
+        ]
+        if not lines:
+            continue
+        items.append(marker + lines[0])
+        items.extend(_indent(line, len(marker)) for line in lines[1:])
+    return "\n\n" + "\n".join(items) + "\n\n"
+
+
+def _convert_row(node: Tag) -> str:
+    """Converts a table row, underlining it if it is a header row."""
+    cells = node.find_all(("td", "th"), recursive=False)
+    row = " | ".join(
+        _WHITESPACE_RE.sub(" ", _convert_children(cell)).strip()
+        for cell in cells
+    )
+    text = f"| {row} |\n"
+    # Tables without header cells use their first row as the header
+    table = node.find_parent("table")
+    is_header = all(cell.name == "th" for cell in cells) or (
+        table is not None
+        and table.find("tr") is node
+        and table.find("th") is None
+    )
+    if cells and is_header:
+        text += "| " + " | ".join(["---"] * len(cells)) + " |\n"
+    return text
+
+
+def _wrap(text: str, marker: str) -> str:
+    """Wraps text in an inline marker, keeping surrounding whitespace."""
+    stripped = text.strip()
+    if not stripped:
+        return text
+    leading = " " if text[0].isspace() else ""
+    trailing = " " if text[-1].isspace() else ""
+    return f"{leading}{marker}{stripped}{marker}{trailing}"
+
+
+# pylint: disable=too-many-return-statements,too-many-branches
+def _convert(node) -> str:
+    """Converts a single node of the tree into Markdown."""
+    if isinstance(node, NavigableString):
+        # Comments, CDATA, doctypes and the like carry no visible text
+        if isinstance(node, PreformattedString):
+            return ""
+        return _ESCAPE_RE.sub(r"\\\1", _WHITESPACE_RE.sub(" ", str(node)))
+    if not isinstance(node, Tag) or node.name in _SKIP_TAGS:
+        return ""
+
+    name = node.name
+    if name == "br":
+        return "\n"
+    if name == "hr":
+        return "\n\n---\n\n"
+    if name == "img":
+        src = node.get("src")
+        return f"![{node.get('alt', '')}]({src})" if src else ""
+
+    if name == "pre":
+        # Keep line breaks and indentation of preformatted text as is
+        code = _indent(node.get_text().strip("\n"), 0)
+        return f"\n\n```\n{code}\n```\n\n"
+    if name in _LIST_TAGS:
+        return _convert_list(node)
+    if name == "tr":
+        return _convert_row(node)
+
+    if name == "code":
+        # Inline code is shown verbatim, so its text is not escaped
+        return _wrap(_WHITESPACE_RE.sub(" ", node.get_text()), "`")
+
+    text = _convert_children(node)
+    if name in _HEADING_LEVELS:
+        return f"\n\n{'#' * _HEADING_LEVELS[name]} {text.strip()}\n\n"
+    if name in ("strong", "b"):
+        return _wrap(text, "**")
+    if name in ("em", "i"):
+        return _wrap(text, "*")
+    if name == "a":
+        href = node.get("href")
+        return f"[{text.strip()}]({href})" if href else text
+    if name in _BLOCK_TAGS:
+        return f"\n\n{text.strip()}\n\n"
+    return text
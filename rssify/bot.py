@@ -1,6 +1,8 @@
 import logging
 import asyncio
-from typing import List, Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from aiohttp import web
 
 import discord
@@ -12,6 +14,73 @@ from discord_rss_bot.rss import RSSReader
 from discord_rss_bot.message import format_entry_for_discord
 from discord_rss_bot.models import FeedConfig
 
+# Discord limits a single message to 10 embeds and 6000 embed characters,
+# and its text content to 2000 characters.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+MAX_MESSAGE_CHARS = 2000
+
+EMBED_CACHE_SIZE = 1024
+
+EmbedCacheKey = Tuple[str, str, Optional[datetime]]
+EmbedCache = OrderedDict[EmbedCacheKey, discord.Embed]
+
+
+def _embed_cache_key(entry: "Entry") -> EmbedCacheKey:
+    """Identifies an entry together with the version of its content."""
+    # reader bumps last_updated whenever it stores new entry content
+    feed_url, entry_id = entry.resource_id
+    return feed_url, entry_id, entry.last_updated
+
+
+def _leaf_exceptions(group: BaseExceptionGroup) -> Iterator[BaseException]:
+    """Yields the exceptions of a group, flattening nested groups."""
+    for e in group.exceptions:
+        if isinstance(e, BaseExceptionGroup):
+            yield from _leaf_exceptions(e)
+        else:
+            yield e
+
+
+def _format_entry(
+    entry: "Entry", feed: FeedConfig, embed_cache: EmbedCache
+) -> discord.Embed:
+    """Formats an entry, reusing the embed built on a previous attempt."""
+    key = _embed_cache_key(entry)
+    embed = embed_cache.get(key)
+    if embed is not None:
+        embed_cache.move_to_end(key)
+        return embed
+
+    embed = format_entry_for_discord(entry, feed)
+    embed_cache[key] = embed
+    if len(embed_cache) > EMBED_CACHE_SIZE:
+        embed_cache.popitem(last=False)  # Evict the least recently used
+    return embed
+
+
+def _batch_entries(
+    entries: Sequence["Entry"], feed: FeedConfig, embed_cache: EmbedCache
+) -> List[List[Tuple["Entry", discord.Embed]]]:
+    """Formats entries and groups them into batches that fit one message."""
+    batches: List[List[Tuple["Entry", discord.Embed]]] = []
+    batch: List[Tuple["Entry", discord.Embed]] = []
+    batch_chars = 0
+    for entry in entries:
+        embed = _format_entry(entry, feed, embed_cache)
+        embed_chars = len(embed)
+        if batch and (
+            len(batch) >= MAX_EMBEDS_PER_MESSAGE
+            or batch_chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            batches.append(batch)
+            batch, batch_chars = [], 0
+        batch.append((entry, embed))
+        batch_chars += embed_chars
+    if batch:
+        batches.append(batch)
+    return batches
+
 
 class DiscordBot(discord.Client):
     """Custom Discord bot class for posting RSS updates."""
@@ -20,7 +89,15 @@ class DiscordBot(discord.Client):
         """Initialize the bot."""
         super().__init__(**kwargs)
         self.rss_reader = rss_reader
-        self.is_ready_flag = False
+        self._ready_event = asyncio.Event()
+        self._cycle_lock = asyncio.Lock()
+        self._channel_cache: dict[int, discord.TextChannel] = {}
+        # Discord serializes sends per channel, so allow one in-flight send
+        # per channel and cap the total number of concurrent sends.
+        self._channel_sems: dict[int, asyncio.Semaphore] = {}
+        self._global_sem = asyncio.Semaphore(32)
+        # Embeds of entries that have not been marked as read yet
+        self._embed_cache: EmbedCache = OrderedDict()
 
     async def on_ready(self):
         """Runs when the bot successfully connects to Discord."""
@@ -29,47 +106,101 @@ class DiscordBot(discord.Client):
             self.user,
             self.user.id,  # pyright: ignore[reportOptionalMemberAccess]
         )
-        self.is_ready_flag = True  # Mark bot as ready
-        self.check_feeds.start()  # Start the periodic task
+        for feed in self.rss_reader.config.feeds:
+            self._get_channel(feed.channel_id)  # Pre-warm channel cache
+        self._ready_event.set()  # Mark bot as ready
+        if not self.check_feeds.is_running():
+            self.check_feeds.start()  # Start the periodic task
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Drops a deleted channel from the channel cache."""
+        self._channel_cache.pop(channel.id, None)
+
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, _after: discord.abc.GuildChannel
+    ):
+        """Drops an updated channel from the channel cache."""
+        self._channel_cache.pop(before.id, None)
 
     @tasks.loop(minutes=5)
     async def check_feeds(self):
+        """Runs a feed check cycle unless the previous one is still running."""
+        if self._cycle_lock.locked():
+            logging.warning("Previous feed check is still running, skipping")
+            return
+
+        async with self._cycle_lock:
+            try:
+                await self._check_feeds()
+            except ExceptionGroup as group:
+                # tasks.Loop only retries on bare connection errors, so
+                # raise the first error instead of the group wrapping it
+                raise next(_leaf_exceptions(group)) from group
+
+    async def _check_feeds(self) -> None:
         """Fetches updates for all feeds and processes them."""
         logging.info("Checking for new RSS updates...")
-        await self.rss_reader.update_feeds(scheduled=True)
+        pending_feeds: Dict[str, List[FeedConfig]] = {}
+        for feed in self.rss_reader.config.feeds:
+            pending_feeds.setdefault(feed.feed_url, []).append(feed)
+
+        # Process all feeds concurrently, starting each one as soon as
+        # its update completes
+        async with asyncio.TaskGroup() as tg:
+            async for result in self.rss_reader.update_feeds_iter(
+                scheduled=True
+            ):
+                for feed in pending_feeds.pop(result.url, []):
+                    tg.create_task(self._process_feed(feed))
 
-        feeds = [
-            self._process_feed(feed) for feed in self.rss_reader.config.feeds
-        ]
-        await asyncio.gather(*feeds)  # Process all feeds concurrently
+            # Feeds that were not due for an update may still have unread
+            # entries
+            for remaining in pending_feeds.values():
+                for feed in remaining:
+                    tg.create_task(self._process_feed(feed))
 
     async def _process_feed(self, feed: FeedConfig) -> None:
         """Processes a single RSS feed and posts updates to Discord."""
         try:
-            unread_entries = await self.rss_reader.get_unread_entries(
+            channel = None
+            async for unread_entries in self.rss_reader.iter_unread_entries(
                 feed.feed_url
-            )
+            ):
+                if channel is None:
+                    channel = self._get_channel(feed.channel_id)
+                    if not channel:
+                        logging.error(
+                            "Invalid channel ID %s for feed %s",
+                            feed.channel_id,
+                            feed.feed_url,
+                        )
+                        return
+
+                await self._process_entries(unread_entries, feed, channel)
+
+                # Mark entries as read after successful processing, keeping
+                # the embeds of any that failed for the next attempt
+                for entry in await self.rss_reader.mark_entries_as_read(
+                    unread_entries
+                ):
+                    self._embed_cache.pop(_embed_cache_key(entry), None)
 
-            if not unread_entries:
+            if channel is None:
                 logging.info("No unread entries for feed %s", feed.feed_url)
-                return
 
-            channel = self._get_channel(feed.channel_id)
-            if not channel:
+        except* (reader.ReaderError, discord.DiscordException) as group:
+            for e in _leaf_exceptions(group):
+                logging.error("Error processing feed %s: %s", feed.feed_url, e)
+        except* Exception as group:  # pylint: disable=W0718
+            # Keep unexpected errors, such as connection resets, from
+            # cancelling the other feeds of this cycle
+            for e in _leaf_exceptions(group):
                 logging.error(
-                    "Invalid channel ID %s for feed %s",
-                    feed.channel_id,
+                    "Unexpected error processing feed %s: %s",
                     feed.feed_url,
+                    e,
+                    exc_info=e,
                 )
-                return
-
-            await self._process_entries(unread_entries, feed, channel)
-
-            # Mark entries as read after successful processing
-            await self.rss_reader.mark_entries_as_read(unread_entries)
-
-        except (reader.ReaderError, discord.DiscordException) as e:
-            logging.error("Error processing feed %s: %s", feed.feed_url, e)
 
     async def _process_entries(
         self,
@@ -82,19 +213,56 @@ class DiscordBot(discord.Client):
             "Sending %d entries to channel %s", len(entries), feed.channel_id
         )
 
-        message_tasks = [
-            self._send_entry(entry, feed, channel)
-            for entry in reversed(entries)
-        ]
-        await asyncio.gather(*message_tasks)  # Send all messages concurrently
+        # Send all messages concurrently
+        async with asyncio.TaskGroup() as tg:
+            for batch in _batch_entries(entries, feed, self._embed_cache):
+                tg.create_task(self._send_batch(batch, feed, channel))
+
+    async def _send_batch(
+        self,
+        batch: List[Tuple["Entry", discord.Embed]],
+        feed: FeedConfig,
+        channel: discord.TextChannel,
+    ) -> None:
+        """Sends a batch of formatted RSS entries as a single message."""
+        channel_sem = self._channel_sems.setdefault(
+            channel.id, asyncio.Semaphore(1)
+        )
+        async with channel_sem, self._global_sem:
+            if len(batch) == 1:
+                await self._send_entry(*batch[0], feed, channel)
+                return
+
+            links = [entry.link for entry, _ in batch]
+            try:
+                await channel.send(embeds=[embed for _, embed in batch])
+                logging.info(
+                    "Sent entries %s to channel %s", links, feed.channel_id
+                )
+
+            except discord.HTTPException as e:
+                # Discord rejects the whole message if any embed is invalid,
+                # so fall back to sending the entries one at a time
+                logging.warning(
+                    "Error sending entries %s to channel %s, "
+                    "retrying one by one: %s",
+                    links,
+                    feed.channel_id,
+                    e,
+                )
+                for entry, embed in batch:
+                    await self._send_entry(entry, embed, feed, channel)
 
     async def _send_entry(
-        self, entry: "Entry", feed: FeedConfig, channel: discord.TextChannel
+        self,
+        entry: "Entry",
+        embed: discord.Embed,
+        feed: FeedConfig,
+        channel: discord.TextChannel,
     ) -> None:
-        """Formats and sends an RSS entry to a Discord channel."""
+        """Sends a single formatted RSS entry to a Discord channel."""
         try:
-            message_embded = format_entry_for_discord(entry)
-            await channel.send(embed=message_embded)
+            await channel.send(embed=embed)
             logging.info(
                 "Sent entry %s to channel %s", entry.link, feed.channel_id
             )
@@ -109,15 +277,22 @@ class DiscordBot(discord.Client):
             error_message = (
                 f"❗ Failed to send entry [{entry.link}] due to an error: {e}"
             )
-            await channel.send(error_message)  # Notify in Discord channel
+            # Notify in Discord channel, within the message length limit
+            await channel.send(error_message[:MAX_MESSAGE_CHARS])
 
     def _get_channel(
         self, channel_id: int | str
     ) -> Optional[discord.TextChannel]:
         """Retrieves and validates the Discord channel."""
         try:
-            channel = self.get_channel(int(channel_id))
+            channel_id = int(channel_id)
+            cached = self._channel_cache.get(channel_id)
+            if cached is not None:
+                return cached
+
+            channel = self.get_channel(channel_id)
             if isinstance(channel, discord.TextChannel):
+                self._channel_cache[channel_id] = channel
                 return channel
 
             logging.error(
@@ -148,15 +323,14 @@ class DiscordBot(discord.Client):
 
     async def readiness_probe(self, _request):
         """Readiness probe – Returns 200 if bot is ready to process requests."""
-        if self.is_ready_flag:
+        if self._ready_event.is_set():
             return web.Response(text="I'm ready!", status=200)
         return web.Response(text="I'm not ready yet.", status=503)
 
     async def start(self, token: str, *_args, **_kwargs):
         """Start the bot and healthcheck server in parallel."""
-        await asyncio.gather(
+        async with asyncio.TaskGroup() as tg:
             # Start healthchecks
-            self.start_healthchecks(),
+            tg.create_task(self.start_healthchecks())
             # Start Discord bot
-            super().start(token),
-        )
+            tg.create_task(super().start(token))
@@ -1,73 +1,93 @@
 import logging
+from typing import Any, Dict, Optional
 
 from reader.types import Entry
-from markdownify import markdownify as md
 from bs4 import BeautifulSoup
 import discord
 
+from discord_rss_bot._md import tree_to_markdown
+from discord_rss_bot.models import FeedConfig
 
-def truncate_html(html: str, length: int = 3000):
-    """Safely truncates provided HTML string."""
-    if len(html) <= length:
-        return html
+_BLUE = 0x3498DB  # discord.Color.blue()
+_TITLE_PREFIX = "📰 "
+_SUMMARY_PREFIX = "💬 **Summary:**\n\n"
+_NO_SUMMARY = f"{_SUMMARY_PREFIX}_No Summary Provided_"
 
-    soup = BeautifulSoup(html[:length], "html.parser")
-    # Append a truncation indicator inside a <strong> tag
-    truncated_tag = soup.new_tag("strong")
-    truncated_tag.string = " ... (truncated)"
-    soup.append(truncated_tag)
-    return str(soup)
+SUMMARY_MAX_LENGTH = 3000
 
 
-def extract_images_from_html(html: str):
-    """Extracts image URLs from an HTML string."""
-    soup = BeautifulSoup(html, features="html.parser")
-    images = [
-        img.attrs["src"]  # pyright: ignore[reportAttributeAccessIssue]
-        for img in soup.find_all("img")
-        if "src" in img.attrs  # pyright: ignore[reportAttributeAccessIssue]
-    ]
-    return images
+def parse_html(
+    html_text: str, length: int = SUMMARY_MAX_LENGTH
+) -> BeautifulSoup:
+    """Parses provided HTML string, safely truncating it if needed."""
+    soup = BeautifulSoup(html_text[:length], "lxml")
+    if len(html_text) > length:
+        # Append a truncation indicator inside a <strong> tag
+        truncated_tag = soup.new_tag("strong")
+        truncated_tag.string = " ... (truncated)"
+        (soup.body or soup).append(truncated_tag)
+    return soup
 
 
-def convert_html_to_markdown(html: str) -> str:
-    """Converts an HTML string into Markdown format."""
-    markdown_text = md(html, heading_style="ATX").strip()
+def extract_first_image(soup: BeautifulSoup) -> Optional[str]:
+    """Extracts the first image URL from a parsed HTML tree."""
+    img = soup.find("img", src=True)
+    return img["src"] if img else None  # pyright: ignore[reportIndexIssue]
+
+
+def convert_html_to_markdown(soup: BeautifulSoup) -> str:
+    """Converts a parsed HTML tree into Markdown format."""
+    markdown_text = tree_to_markdown(soup)
     formatted_text = "\n".join(
         f"> {line}" for line in markdown_text.splitlines() if line.strip()
     )
     return formatted_text
 
 
-def format_entry_for_discord(entry: Entry) -> discord.Embed:
+def _build_embed(
+    entry: Entry,
+    feed: FeedConfig,
+    description: str,
+    image_url: Optional[str] = None,
+) -> discord.Embed:
+    """Builds a discord.Embed for an entry from its raw payload."""
+    # Build the raw payload and skip the Embed property setters
+    payload: Dict[str, Any] = {
+        "type": "rich",
+        "title": f"{_TITLE_PREFIX}{entry.title}",
+        "url": entry.link,
+        "color": _BLUE,
+        "description": description,
+        "footer": {"text": feed.footer_text},
+    }
+
+    published = entry.published
+    if published:
+        payload["timestamp"] = published.isoformat()
+
+    if image_url:
+        payload["image"] = {"url": image_url}
+    return discord.Embed.from_dict(payload)
+
+
+def _build_minimal_embed(entry: Entry, feed: FeedConfig) -> discord.Embed:
+    """Builds a discord.Embed for an entry without a summary."""
+    return _build_embed(entry, feed, _NO_SUMMARY)
+
+
+def format_entry_for_discord(entry: Entry, feed: FeedConfig) -> discord.Embed:
     """Formats a single RSS entry into a discord.Embed."""
     logging.debug("Formatting entry")
 
-    title = f"📰 {entry.title}"
-    summary_md = ""
-    image_urls = []
-    if hasattr(entry, "summary") and entry.summary:
-        truncated_summary = truncate_html(entry.summary)
-        image_urls = extract_images_from_html(
-            truncated_summary
-        )  # Extract images first
-        summary_md = convert_html_to_markdown(
-            truncated_summary
-        )  # Convert to Markdown
-
-    embed = discord.Embed(
-        title=title, url=entry.link, color=discord.Color.blue()
-    )
-    embed.description = (
-        f"💬 **Summary:**\n\n{summary_md}"
-        if summary_md
-        else "💬 **Summary:**\n\n_No Summary Provided_"
-    )
-
-    if hasattr(entry, "published") and entry.published:
-        embed.timestamp = entry.published
+    summary = entry.summary
+    if not summary or summary.isspace():
+        return _build_minimal_embed(entry, feed)
 
-    embed.set_footer(text=f"🔗 {entry.feed_url} 🔗")
-    if image_urls:
-        embed.set_image(url=image_urls[0])
-    return embed
+    soup = parse_html(summary)  # Parse the summary only once
+    image_url = extract_first_image(soup)
+    summary_md = convert_html_to_markdown(soup)  # Convert to Markdown
+    if not summary_md:
+        return _build_embed(entry, feed, _NO_SUMMARY, image_url)
+    return _build_embed(
+        entry, feed, f"{_SUMMARY_PREFIX}{summary_md}", image_url
+    )
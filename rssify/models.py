@@ -1,5 +1,6 @@
+from functools import cached_property
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class FeedConfig(BaseModel):
@@ -13,6 +14,12 @@ class FeedConfig(BaseModel):
         None, description="Update interval in minutes (if set)."
     )
 
+    @computed_field
+    @cached_property
+    def footer_text(self) -> str:
+        """Footer text shown on every message posted for this feed."""
+        return f"🔗 {self.feed_url} 🔗"
+
 
 class ConfigFile(BaseModel):
     """Represents the main configuration file for the bot."""
@@ -21,3 +28,6 @@ class ConfigFile(BaseModel):
     feeds: List[FeedConfig] = Field(
         ..., description="List of configured RSS feeds."
     )
+    update_workers: int = Field(
+        8, ge=1, description="Maximum number of feeds to fetch in parallel."
+    )
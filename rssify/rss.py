@@ -1,21 +1,79 @@
 import asyncio
+import functools
 import logging
-from typing import Any, Callable, List, Optional, Set, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    AbstractSet,
+    Any,
+    AsyncIterator,
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from reader import Reader, ReaderError, make_reader
-from reader.types import Entry
+from reader.plugins import DEFAULT_PLUGINS
+from reader.types import Entry, UpdateResult
+from requests.adapters import HTTPAdapter
 
 from discord_rss_bot.models import ConfigFile
 
 T = TypeVar("T")
 
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with a larger connection pool and a default timeout."""
+
+    def __init__(self, timeout: Any, **kwargs: Any) -> None:
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    # pylint: disable=arguments-differ
+    def send(self, request, **kwargs):  # type: ignore[override]
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def http_connection_pool_plugin(rss_reader: Reader) -> None:
+    """Reader plugin that enlarges the connection pool of its HTTP session."""
+
+    # pylint: disable=protected-access
+    @rss_reader._parser.lazy_init
+    def init_parser(parser):
+        # Lazy init functions run last in, first out, so this one runs
+        # before reader's own init has mounted the HTTP retriever. That is
+        # safe: get_retriever() re-enters the lazy init and runs the
+        # remaining functions first, the same way the built-in ua_fallback
+        # plugin gets hold of the retriever.
+        retriever = parser.get_retriever("http://")
+        adapter = PooledHTTPAdapter(
+            retriever.timeout,
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+        )
+        retriever.session.mount("https://", adapter)
+        retriever.session.mount("http://", adapter)
+
 
 # pylint: disable=too-few-public-methods
 class ReaderTaskExecutor:
     """Helper class that runs blocking reader tasks in a separate thread."""
 
-    def __init__(self, rss_reader: Reader) -> None:
+    def __init__(self, rss_reader: Reader, max_workers: int = 16) -> None:
         self.rss_reader = rss_reader
+        # Dedicated pool, so reader work does not compete with the default
+        # executor used by discord.py and aiohttp
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="reader"
+        )
 
     async def run(
         self,
@@ -26,11 +84,18 @@ class ReaderTaskExecutor:
     ) -> Optional[T]:
         """Runs a blocking reader task in a separate thread."""
         try:
-            return await asyncio.to_thread(func, *args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
         except ReaderError as error:
             logging.error("Error executing task: %s", error)
             return default
 
+    def shutdown(self) -> None:
+        """Waits for running tasks and shuts down the thread pool."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
 
 class FeedManager:
     """Encapsulates feed operations and manages RSS feed interactions using the reader"""
@@ -57,12 +122,44 @@ class FeedManager:
         except ReaderError as error:
             logging.error("Error adding feed %s: %s", feed_url, error)
 
-    async def update_feeds(self, scheduled: bool = True) -> None:
+    async def update_feeds(
+        self, scheduled: bool = True, workers: int = 1
+    ) -> None:
         """Updates all RSS feeds."""
-        logging.info("Updating RSS feeds (scheduled=%s)", scheduled)
+        logging.info(
+            "Updating RSS feeds (scheduled=%s, workers=%d)", scheduled, workers
+        )
         await self.executor.run(
-            self.rss_reader.update_feeds, scheduled=scheduled
+            self.rss_reader.update_feeds, scheduled=scheduled, workers=workers
+        )
+
+    async def update_feeds_iter(
+        self, scheduled: bool = True, workers: int = 1
+    ) -> AsyncIterator[UpdateResult]:
+        """Updates all RSS feeds, yielding each result as it completes."""
+        logging.info(
+            "Updating RSS feeds (scheduled=%s, workers=%d)", scheduled, workers
         )
+        loop = asyncio.get_running_loop()
+        results: asyncio.Queue[Optional[UpdateResult]] = asyncio.Queue()
+
+        def update() -> None:
+            try:
+                for result in self.rss_reader.update_feeds_iter(
+                    scheduled=scheduled, workers=workers
+                ):
+                    loop.call_soon_threadsafe(results.put_nowait, result)
+            finally:
+                loop.call_soon_threadsafe(results.put_nowait, None)
+
+        updater = asyncio.ensure_future(self.executor.run(update))
+        while (result := await results.get()) is not None:
+            if isinstance(result.value, ReaderError):
+                logging.error(
+                    "Error updating feed %s: %s", result.url, result.value
+                )
+            yield result
+        await updater
 
     async def get_existing_feeds(self) -> Set[str]:
         """Retrieves the set of feed URLs currently registered in the reader."""
@@ -79,43 +176,74 @@ class FeedManager:
         except ReaderError as error:
             logging.error("Error removing feed %s: %s", feed_url, error)
 
-    async def get_unread_entries(self, feed_url: str) -> List[Entry]:
-        """Retrieves unread entries for a given feed."""
-        logging.info("Fetching unread entries for %s", feed_url)
-        entries = await self.executor.run(
-            lambda: list(
-                self.rss_reader.get_entries(feed=feed_url, read=False)
-            ),
-            default=[],
+    def _get_unread_entry_ids(self, feed_url: str) -> List[Tuple[str, str]]:
+        """Retrieves the IDs of unread entries for a given feed, oldest first."""
+        entry_ids = [
+            entry.resource_id
+            for entry in self.rss_reader.get_entries(feed=feed_url, read=False)
+        ]
+        entry_ids.reverse()  # reader only sorts entries newest first
+        return entry_ids
+
+    def _get_entries(self, entry_ids: List[Tuple[str, str]]) -> List[Entry]:
+        """Retrieves the given entries, skipping ones that no longer exist."""
+        entries = (
+            self.rss_reader.get_entry(entry_id, None) for entry_id in entry_ids
         )
-        return entries if entries is not None else []
+        return [entry for entry in entries if entry is not None]
 
-    async def mark_entry_as_read(self, entry: Entry) -> None:
-        """Marks a single entry as read."""
-        try:
-            await self.executor.run(self.rss_reader.mark_entry_as_read, entry)
-        except ReaderError as error:
-            logging.error(
-                "Error marking entry '%s' as read: %s", entry.title, error
+    async def iter_unread_entries(
+        self, feed_url: str, batch_size: int = 50
+    ) -> AsyncIterator[List[Entry]]:
+        """Yields unread entries for a given feed in batches, oldest first."""
+        logging.info("Fetching unread entries for %s", feed_url)
+        # Only the IDs of the whole backlog are held in memory; entries
+        # are loaded one batch at a time, keeping chronological order.
+        entry_ids = (
+            await self.executor.run(self._get_unread_entry_ids, feed_url) or []
+        )
+        for start in range(0, len(entry_ids), batch_size):
+            entries = await self.executor.run(
+                self._get_entries,
+                entry_ids[start : start + batch_size],
+                default=[],
             )
+            if entries:
+                yield entries
+
+    def _mark_entries_as_read(self, entries: List[Entry]) -> List[Entry]:
+        """Marks entries as read one by one in the calling thread."""
+        marked = []
+        for entry in entries:
+            try:
+                self.rss_reader.mark_entry_as_read(entry)
+                marked.append(entry)
+            except ReaderError as error:
+                logging.error(
+                    "Error marking entry '%s' as read: %s", entry.title, error
+                )
+        return marked
 
-    async def mark_entries_as_read(self, entries: List[Entry]) -> None:
-        """Marks the provided list of entries as read."""
+    async def mark_entries_as_read(self, entries: List[Entry]) -> List[Entry]:
+        """Marks the provided entries as read and returns the marked ones."""
         if not entries:
-            return
+            return []
 
         logging.info("Marking %d entries as read", len(entries))
-        tasks = [self.mark_entry_as_read(entry) for entry in entries]
-        await asyncio.gather(*tasks)
+        # A single thread hop for the whole batch instead of one per entry
+        marked = await self.executor.run(self._mark_entries_as_read, entries)
+        return marked if marked is not None else []
 
-    async def cleanup_removed_feeds(self, config_feeds: Set[str]) -> None:
+    async def cleanup_removed_feeds(
+        self, config_feeds: AbstractSet[str]
+    ) -> None:
         """Removes feeds from the reader that are not in the provided configuration."""
         existing_feeds = await self.get_existing_feeds()
         feeds_to_remove = existing_feeds - config_feeds
 
-        if feeds_to_remove:
-            tasks = [self.delete_feed(feed_url) for feed_url in feeds_to_remove]
-            await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for feed_url in feeds_to_remove:
+                tg.create_task(self.delete_feed(feed_url))
 
 
 class RSSReader:
@@ -132,39 +260,80 @@ class RSSReader:
         self.task_executor = ReaderTaskExecutor(self.reader)
         self.feed_manager = FeedManager(self.reader, self.task_executor)
 
+    @property
+    def config(self) -> ConfigFile:
+        """The bot configuration."""
+        return self._config
+
+    @config.setter
+    def config(self, config: ConfigFile) -> None:
+        self._config = config
+        # Recomputed whenever the configuration is replaced
+        self._config_feed_urls: FrozenSet[str] = frozenset(
+            feed.feed_url for feed in config.feeds
+        )
+
     def _init_reader(self) -> None:
         """Initializes the underlying reader instance."""
         logging.info("Initializing RSS reader")
         try:
-            self.reader = make_reader(self.config.db_path)
+            self.reader = make_reader(
+                self.config.db_path,
+                plugins=[*DEFAULT_PLUGINS, http_connection_pool_plugin],
+            )
         except ReaderError as error:
             logging.error("Error initializing reader: %s", error)
             raise
 
     async def add_feeds(self) -> None:
         """Adds all feeds specified in the configuration."""
-        tasks = [
-            self.feed_manager.add_feed(feed.feed_url, feed.update_interval)
-            for feed in self.config.feeds
-        ]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for feed in self.config.feeds:
+                tg.create_task(
+                    self.feed_manager.add_feed(
+                        feed.feed_url, feed.update_interval
+                    )
+                )
 
     async def update_feeds(self, scheduled: bool = True) -> None:
         """Updates the RSS feeds."""
-        await self.feed_manager.update_feeds(scheduled=scheduled)
+        await self.feed_manager.update_feeds(
+            scheduled=scheduled, workers=self._update_workers()
+        )
+
+    async def update_feeds_iter(
+        self, scheduled: bool = True
+    ) -> AsyncIterator[UpdateResult]:
+        """Updates the RSS feeds, yielding each result as it completes."""
+        async for result in self.feed_manager.update_feeds_iter(
+            scheduled=scheduled, workers=self._update_workers()
+        ):
+            yield result
+
+    def _update_workers(self) -> int:
+        """Returns the number of feeds to fetch in parallel."""
+        return max(1, min(self.config.update_workers, len(self.config.feeds)))
 
     async def cleanup_removed_feeds(self) -> None:
         """Removes feeds that are no longer in the configuration."""
-        config_feeds = {feed.feed_url for feed in self.config.feeds}
-        await self.feed_manager.cleanup_removed_feeds(config_feeds)
+        await self.feed_manager.cleanup_removed_feeds(self._config_feed_urls)
 
-    async def get_unread_entries(self, feed_url: str) -> List[Entry]:
-        """Retrieves unread entries for a specified feed."""
-        return await self.feed_manager.get_unread_entries(feed_url)
+    async def iter_unread_entries(
+        self, feed_url: str, batch_size: int = 50
+    ) -> AsyncIterator[List[Entry]]:
+        """Yields unread entries for a specified feed in batches."""
+        async for entries in self.feed_manager.iter_unread_entries(
+            feed_url, batch_size
+        ):
+            yield entries
 
-    async def mark_entries_as_read(self, entries: List[Entry]) -> None:
-        """Marks specified entries as read."""
-        await self.feed_manager.mark_entries_as_read(entries)
+    async def mark_entries_as_read(self, entries: List[Entry]) -> List[Entry]:
+        """Marks specified entries as read and returns the marked ones."""
+        return await self.feed_manager.mark_entries_as_read(entries)
+
+    def close(self) -> None:
+        """Shuts down the thread pool used for blocking reader tasks."""
+        self.task_executor.shutdown()
 
     async def setup(self) -> None:
         """
@@ -173,6 +342,14 @@ class RSSReader:
         2. Cleaning up removed feeds
         3. Performing an initial update.
         """
-        await asyncio.gather(self.add_feeds(), self.cleanup_removed_feeds())
+        # Let both steps finish even if the other one fails
+        results = await asyncio.gather(
+            self.add_feeds(),
+            self.cleanup_removed_feeds(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         # Immediate update after setup
         await self.update_feeds(scheduled=False)
@@ -1,4 +1,5 @@
 import argparse
+import functools
 import os
 import logging
 import sys
@@ -7,6 +8,12 @@ import yaml
 from pydantic import ValidationError
 from discord_rss_bot.models import ConfigFile
 
+# Prefer the libyaml-backed loader, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 def get_bot_token(args: argparse.Namespace) -> str:
     """Get the bot token from arguments or environment"""
@@ -22,14 +29,20 @@ def get_bot_token(args: argparse.Namespace) -> str:
     raise ValueError("Bot token was not provided.")
 
 
+@functools.lru_cache(maxsize=1)
+def _read_config(config_path: str, _mtime: float) -> ConfigFile:
+    """Parse the config file, cached by path and modification time."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        config_data = yaml.load(f, Loader=_Loader)
+        return ConfigFile(**config_data)
+
+
 def load_config(config_path: str) -> ConfigFile:
     """Load the config file."""
     logging.info("Loading configuration from %s", config_path)
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
-            return ConfigFile(**config_data)
+        return _read_config(config_path, os.path.getmtime(config_path))
 
     except FileNotFoundError:
         logging.error("Configuration file not found at: %s", config_path)
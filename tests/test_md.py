@@ -0,0 +1,104 @@
+import unittest
+
+from bs4 import BeautifulSoup
+
+from discord_rss_bot._md import tree_to_markdown
+
+
+def to_markdown(html_text: str) -> str:
+    """Parses an HTML string and converts it into Markdown."""
+    return tree_to_markdown(BeautifulSoup(html_text, "lxml"))
+
+
+class TreeToMarkdownTest(unittest.TestCase):
+    """Checks the converter against the output of markdownify 0.14.1."""
+
+    def test_inline_markup(self):
+        self.assertEqual(
+            to_markdown(
+                '<p>A <b>bold</b>, <em>em</em> and <a href="https://x.y">'
+                "link</a></p>"
+            ),
+            "A **bold**, *em* and [link](https://x.y)",
+        )
+
+    def test_text_is_escaped(self):
+        self.assertEqual(
+            to_markdown("<p>snake_case *star*</p>"), r"snake\_case \*star\*"
+        )
+
+    def test_inline_code_is_not_escaped(self):
+        self.assertEqual(
+            to_markdown("<p>Use <code>a_b*c</code> here</p>"),
+            "Use `a_b*c` here",
+        )
+
+    def test_headings_and_line_breaks(self):
+        # Unlike markdownify, <br> does not add a two-space hard break
+        self.assertEqual(
+            to_markdown("<h1>T</h1><p>x<br>y</p><h3>S</h3>"),
+            "# T\n\nx\ny\n\n### S",
+        )
+
+    def test_image(self):
+        self.assertEqual(
+            to_markdown('<img src="a.png" alt="pic">'), "![pic](a.png)"
+        )
+
+    def test_table_with_header(self):
+        self.assertEqual(
+            to_markdown(
+                "<table><tr><th>h1</th><th>h2</th></tr>"
+                "<tr><td>a</td><td>b</td></tr></table>"
+            ),
+            "| h1 | h2 |\n| --- | --- |\n| a | b |",
+        )
+
+    def test_table_without_header(self):
+        self.assertEqual(
+            to_markdown(
+                "<table><tr><td>a</td><td>b</td></tr>"
+                "<tr><td>c</td><td>d</td></tr></table>"
+            ),
+            "| a | b |\n| --- | --- |\n| c | d |",
+        )
+
+    def test_pre_keeps_whitespace(self):
+        self.assertEqual(
+            to_markdown("<pre>code\n  indented\n    more</pre>"),
+            "```\ncode\n  indented\n    more\n```",
+        )
+
+    def test_pre_code_is_not_escaped(self):
+        self.assertEqual(
+            to_markdown("<pre><code>def f(a_b):\n    return 1</code></pre>"),
+            "```\ndef f(a_b):\n    return 1\n```",
+        )
+
+    def test_nested_unordered_list(self):
+        self.assertEqual(
+            to_markdown(
+                "<ul><li>one<ul><li>inner a</li><li>inner b</li></ul></li>"
+                "<li>two</li></ul>"
+            ),
+            "* one\n  + inner a\n  + inner b\n* two",
+        )
+
+    def test_nested_ordered_list(self):
+        self.assertEqual(
+            to_markdown("<ol><li>a<ol><li>x</li></ol></li><li>b</li></ol>"),
+            "1. a\n   1. x\n2. b",
+        )
+
+    def test_ordered_list_start(self):
+        self.assertEqual(
+            to_markdown('<ol start="3"><li>x</li><li>y</li></ol>'),
+            "3. x\n4. y",
+        )
+
+    def test_ordered_list_invalid_start(self):
+        self.assertEqual(to_markdown('<ol start="a"><li>x</li></ol>'), "1. x")
+
+
+if __name__ == "__main__":
+    unittest.main()
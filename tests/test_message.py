@@ -0,0 +1,26 @@
+import unittest
+
+from discord_rss_bot.message import extract_first_image, parse_html
+
+
+class ExtractFirstImageTest(unittest.TestCase):
+    """Checks which image is picked from an entry summary."""
+
+    def test_first_image(self):
+        soup = parse_html("<p><img alt='x'><img src=a.png><img src='b.png'>")
+        self.assertEqual(extract_first_image(soup), "a.png")
+
+    def test_no_image(self):
+        self.assertIsNone(extract_first_image(parse_html("<p>hi</p>")))
+
+    def test_commented_out_image(self):
+        soup = parse_html("<!-- <img src='c.png'> --><p>hi</p>")
+        self.assertIsNone(extract_first_image(soup))
+
+    def test_src_with_quote_and_entity(self):
+        soup = parse_html('<img src="it\'s.png?a=1&amp;b=2">')
+        self.assertEqual(extract_first_image(soup), "it's.png?a=1&b=2")
+
+
+if __name__ == "__main__":
+    unittest.main()